@@ -1,65 +1,103 @@
+import re
+import sys
 from typing import Any, List, Dict, Union, Optional
-from abc import ABC, abstractmethod
 
+_ERROR = sys.intern("ERROR")
+_LOG_RE = re.compile(r"(ERROR|INFO):(.*\S.*)", re.S)
+_NUM_FMT = "Processed %d numeric values, sum=%s, avg=%s"
+_NUM_TYPES = (int, float)
+_SMALL_LIMIT = 16
+_SMALL_PROCS: Dict[int, Any] = {}
+_TEXT_FMT = "Processed text: %d characters, %d words"
+_ALERT_FMT = "[ALERT] ERROR level detected:%s"
+_INFO_FMT = "[INFO] INFO level detected:%s"
 
-class DataProcessor(ABC):
 
-    @abstractmethod
+def _make_small_processor(n: int) -> Any:
+    args = ", ".join(f"x{i}" for i in range(n))
+    total = " + ".join(f"x{i}" for i in range(n))
+    src = (f"def _process_{n}({args}):\n"
+           f"    suum = {total}\n"
+           f"    return _NUM_FMT % ({n}, suum, suum / {n})\n")
+    namespace: Dict[str, Any] = {"_NUM_FMT": _NUM_FMT}
+    exec(src, namespace)
+    return namespace[f"_process_{n}"]
+
+
+class DataProcessor:
+
+    __slots__ = ()
+
     def process(self, data: Any) -> str:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def validate(self, data: Any) -> bool:
-        pass
+        raise NotImplementedError
 
     def format_output(self, result: str) -> str:
-        return f"Output: {result}"
+        return "Output: " + result
+
+    def validate_and_process(self, data: Any) -> tuple[bool, str]:
+        if not self.validate(data):
+            return False, ""
+        return True, self.process(data)
 
 
 class NumericProcessor(DataProcessor):
 
+    __slots__ = ()
+
     def process(self, data: Any) -> str:
-        count: int = 0
-        suum: float = 0
-        average: float = 0
-
-        if type(data) is int or type(data) is float:
-            return f"Processed {1} numeric values, sum={data}, avg={data}"
-        count = len(data)
-        suum = sum(data)
-        if count > 0:
-            average = suum / count
-            return (f"Processed {count} numeric values, sum={suum},"
-                    f" avg={average}")
-        else:
+        if type(data) in _NUM_TYPES:
+            return _NUM_FMT % (1, data, data)
+        count: int = len(data)
+        if count == 0:
             return ("Error: you Enter an empty list")
+        if count <= _SMALL_LIMIT:
+            processor = _SMALL_PROCS.get(count)
+            if processor is None:
+                processor = _make_small_processor(count)
+                _SMALL_PROCS[count] = processor
+            return processor(*data)
+        suum: float = sum(data)
+        average: float = suum / count
+        return _NUM_FMT % (count, suum, average)
 
     def validate(self, data: Any) -> bool:
-        if type(data) is int or type(data) is float:
+        if type(data) in _NUM_TYPES:
             return True
         if type(data) is not list:
             return False
+        return all(type(number) in _NUM_TYPES for number in data)
 
-        try:
-            for number in data:
-                number = number + 1
-        except TypeError:
-            return False
-        return True
-
-    def format_output(self, result: str) -> str:
-        return super().format_output(result)
+    def validate_and_process(self, data: Any) -> tuple[bool, str]:
+        if type(data) in _NUM_TYPES:
+            return True, _NUM_FMT % (1, data, data)
+        if type(data) is not list:
+            return False, ""
+        count: int = 0
+        suum: float = 0
+        for number in data:
+            if type(number) not in _NUM_TYPES:
+                return False, ""
+            count += 1
+            suum += number
+        if count == 0:
+            return True, "Error: you Enter an empty list"
+        return True, _NUM_FMT % (count, suum, suum / count)
 
 
 class TextProcessor(DataProcessor):
 
+    __slots__ = ()
+
     def process(self, data: Any) -> str:
         length: int = len(data)
         if length == 0:
             return ("Error: you typed an empty string")
-        wc = len(data.split(' '))
+        wc = data.count(' ') + 1
 
-        return f"Processed text: {length} characters, {wc} words"
+        return _TEXT_FMT % (length, wc)
 
     def validate(self, data: Any) -> bool:
         try:
@@ -69,39 +107,25 @@ class TextProcessor(DataProcessor):
 
         return True
 
-    def format_output(self, result: str) -> str:
-        return super().format_output(result)
-
 
 class LogProcessor(DataProcessor):
 
+    __slots__ = ()
+
     def process(self, data: Any) -> str:
-        splited = data.split(':', 1)
-        type_log = splited[0]
-        msg = splited[1]
-        if type_log == "ERROR":
-            return (f"[ALERT] ERROR level detected:{msg}")
-        elif type_log == "INFO":
-            return (f"[INFO] INFO level detected:{msg}")
-        return "Error: "
+        match = _LOG_RE.fullmatch(data)
+        if match is None:
+            return "Error: "
+        type_log = sys.intern(match.group(1))
+        msg = match.group(2)
+        if type_log is _ERROR:
+            return _ALERT_FMT % msg
+        return _INFO_FMT % msg
 
     def validate(self, data: Any) -> bool:
         if type(data) is not str:
             return False
-        splited_data = data.split(':')
-        if len(splited_data) != 2:
-            return False
-        if splited_data[0] == "ERROR":
-            if splited_data[1].strip():
-                return True
-        if splited_data[0] == "INFO":
-            if splited_data[1].strip():
-                return True
-
-        return False
-
-    def format_output(self, result: str) -> str:
-        return super().format_output(result)
+        return _LOG_RE.fullmatch(data) is not None
 
 
 def processing_numeric_processor() -> None:
@@ -109,9 +133,9 @@ def processing_numeric_processor() -> None:
     numeric = NumericProcessor()
     data = [1, 2, 3, 4, 5]
     print("Processing data:", data)
-    if numeric.validate(data):
+    verified, result = numeric.validate_and_process(data)
+    if verified:
         print("Validation: Numeric data verified")
-        result = numeric.process(data)
         output = numeric.format_output(result)
         print(output)
     else:
@@ -149,11 +173,15 @@ def processing_log_processor() -> None:
 def processing_multiple_data(list_data: List) -> None:
     print("\n=== Polymorphic Processing Demo ===")
     print("Processing multiple data types through same interface...")
-    result = 1
+    count = 1
     for object, data in list_data:
         try:
-            print(f"Result {result}: {object.process(data)}")
-            result += 1
+            verified, result = object.validate_and_process(data)
+            if not verified:
+                print("Error: invalid data !!!")
+                continue
+            print(f"Result {count}: {result}")
+            count += 1
         except Exception:
             print("Error: invalid data !!!")
 
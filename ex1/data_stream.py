@@ -1,47 +1,75 @@
-from abc import ABC, abstractmethod
+import sys
 from typing import Any, List, Dict, Union, Optional
 
+_ROW = "- %s data: %d %s processed"
+_KINDS = frozenset(("buy", "sell"))
 
-class DataStream(ABC):
+
+class DataStream:
+
+    __slots__ = ("stream_id", "_stats", "_parse_key", "_parsed")
+
+    kind: str = "General"
+    unit: str = "items"
 
     def __init__(self, stream_id: Union[str, float, int]) -> None:
+        if type(stream_id) is str:
+            stream_id = sys.intern(stream_id)
         self.stream_id = stream_id
+        self._stats: Dict[str, Union[str, int, float]] = {
+            "stream_id": stream_id, "Type": "General Data"}
+        self._parse_key: Optional[tuple] = None
+        self._parsed: List[tuple] = []
 
-    @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
-        pass
+        raise NotImplementedError
+
+    def _parse_batch(self, data_batch: List[Any]) -> List[tuple]:
+        key = tuple(data_batch)
+        if key != self._parse_key:
+            parsed = []
+            for element in data_batch:
+                kind, _, value = element.partition(':')
+                parsed.append((element, kind, value))
+            self._parse_key = key
+            self._parsed = parsed
+        return self._parsed
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
         return data_batch
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        return {"stream_id": self.stream_id, "Type": "General Data"}
+        return self._stats
+
+    def summarize(self, data_batch: List[Any]) -> Dict[str, Union[str, int]]:
+        return {"kind": self.kind, "count": len(data_batch),
+                "unit": self.unit}
 
 
 class SensorStream(DataStream):
 
+    __slots__ = ()
+
+    kind = "Sensor"
+    unit = "readings"
+
     def __init__(self, stream_id: Union[str, float, int]):
         super().__init__(stream_id)
+        self._stats = {"stream_id": self.stream_id,
+                       "type": "Environmental Data"}
 
     def process_batch(self, data_batch: List[Any]) -> str:
-        if isinstance(data_batch, list) is False:
+        if type(data_batch) is not list:
             return "this is not a valid data !!!"
-        count: int = 0
-        temp: Union[int, float] = 0
-        temp_count: int = 0
         average: Union[int, float] = 0
         try:
-            for element in data_batch:
-                splited = element.split(':')
-                if splited[0] == "temp":
-                    count += 1
-                    temp += float(splited[1])
-                    temp_count += 1
-                else:
-                    count += 1
-            if temp_count > 0:
-                average = temp / temp_count
+            parsed = self._parse_batch(data_batch)
+            count = len(parsed)
+            temps = [float(value) for _, kind, value in parsed
+                     if kind == "temp"]
+            if temps:
+                average = sum(temps) / len(temps)
 
             return (f"Sensor analysis: {count} readings processed,"
                     f" avg temp: {average}°C")
@@ -53,50 +81,42 @@ class SensorStream(DataStream):
                     criteria: Optional[str] = None) -> List[Any]:
         if criteria is None:
             return data_batch
-        filtered: List[str] = []
         if criteria == "critical":
-            for element in data_batch:
-                info = element.split(':')[0]
-                value = float(element.split(':')[1])
-                if info == "temp":
-                    if value > 37:
-                        filtered.append(element)
-
+            keep_hot = True
         elif criteria == "non-critical":
-            for element in data_batch:
-                info = element.split(':')[0]
-                value = float(element.split(':')[1])
-                if info == "temp":
-                    if value <= 37:
-                        filtered.append(element)
-        return filtered
-
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        return {"stream_id": self.stream_id, "type": "Environmental Data"}
+            keep_hot = False
+        else:
+            return []
+        return [element for element, kind, value
+                in self._parse_batch(data_batch)
+                if kind == "temp" and (float(value) > 37) == keep_hot]
 
 
 class TransactionStream(DataStream):
 
+    __slots__ = ()
+
+    kind = "Transaction"
+    unit = "operations"
+
     def __init__(self, stream_id: Union[str, float, int]):
         super().__init__(stream_id)
+        self._stats = {"stream_id": self.stream_id,
+                       "type": "Financial Data"}
 
     def process_batch(self, data_batch: List[Any]) -> str:
-        if isinstance(data_batch, list) is False:
+        if type(data_batch) is not list:
             return "this is not a valid data !!!"
 
-        buy: int = 0
-        sell: int = 0
-        count: int = 0
         try:
-            for element in data_batch:
-                splited = element.split(':')
-                count += 1
-                if splited[0] == "buy":
-                    buy += int(splited[1])
-                elif splited[0] == "sell":
-                    sell += int(splited[1])
-                else:
-                    return "Error when processing Transaction data"
+            parsed = self._parse_batch(data_batch)
+            count: int = len(parsed)
+            if any(kind not in _KINDS for _, kind, _ in parsed):
+                return "Error when processing Transaction data"
+            buy: int = sum(int(value) for _, kind, value in parsed
+                           if kind == "buy")
+            sell: int = sum(int(value) for _, kind, value in parsed
+                            if kind == "sell")
         except Exception:
             return "Error when processing Transaction data"
         net: int = buy - sell
@@ -107,38 +127,34 @@ class TransactionStream(DataStream):
                     criteria: Optional[str] = None) -> List[Any]:
         if criteria is None:
             return data_batch
-        filtered: List[str] = []
         if criteria == "large":
-            for element in data_batch:
-                transaction = element.split(':')[0]
-                value = int(element.split(':')[1])
-                if transaction == "buy" or transaction == "sell":
-                    if value > 150:
-                        filtered.append(element)
-
+            keep_large = True
         elif criteria == "small":
-            for element in data_batch:
-                transaction = element.split(':')[0]
-                value = int(element.split(':')[1])
-                if transaction == "buy" or transaction == "sell":
-                    if value <= 150:
-                        filtered.append(element)
+            keep_large = False
+        else:
+            return []
+        return [element for element, kind, value
+                in self._parse_batch(data_batch)
+                if kind in _KINDS
+                and (int(value) > 150) == keep_large]
 
-        return filtered
 
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        return {"stream_id": self.stream_id, "type": "Financial Data"}
+class EventStream(DataStream):
 
+    __slots__ = ()
 
-class EventStream(DataStream):
+    kind = "Event"
+    unit = "events"
 
     def __init__(self, stream_id: Union[str, float, int]):
         super().__init__(stream_id)
+        self._stats = {"stream_id": self.stream_id,
+                       "type": "System Events"}
 
     def process_batch(self, data_batch: List[Any]) -> str:
         count: int = 0
         errors: int = 0
-        if isinstance(data_batch, list) is False:
+        if type(data_batch) is not list:
             return "this is not a valid data !!!"
         for element in data_batch:
             if element == "error":
@@ -150,14 +166,7 @@ class EventStream(DataStream):
                     criteria: Optional[str] = None) -> List[Any]:
         if criteria is None:
             return data_batch
-        filtered: List[str] = []
-        for element in data_batch:
-            if element == criteria:
-                filtered.append(element)
-        return filtered
-
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        return {"stream_id": self.stream_id, "type": "System Events"}
+        return [element for element in data_batch if element == criteria]
 
 
 def initializing_sensor_stream(object: SensorStream) -> None:
@@ -189,16 +198,16 @@ def initializing_event_stream(object: EventStream) -> None:
 
 class StreamProcessor():
 
+    __slots__ = ()
+
     def process_multiple_streams(self, streams: List) -> None:
-        if isinstance(streams, list) is False:
+        if type(streams) is not list:
             print("this is not a valid data !!!")
             return
         print("Batch 1 Results:")
-        for element in streams:
-            data = element[0].process_batch(element[1])
-            splited = data.split(' ')
-            print(f"- {splited[0]} data: {splited[2]}"
-                  f" {splited[3].strip(',')} processed")
+        for stream, data_batch in streams:
+            meta = stream.summarize(data_batch)
+            print(_ROW % (meta["kind"], meta["count"], meta["unit"]))
 
 
 def process_multiple_streams() -> None:
@@ -1,7 +1,67 @@
+import asyncio
+import contextlib
+import csv
+import io
+import itertools
 import json
+import sys
+import threading
 import time
-from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional, Protocol
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Dict, Optional, Protocol
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_RANGES = ("(Out of range range)", "(Normal range)")
+VERBOSE = True
+_MISSING = object()
+_PARSE_CACHE: Dict[str, Any] = {}
+_PARSE_CACHE_LIMIT = 128
+
+
+@contextlib.contextmanager
+def quiet() -> Any:
+    global VERBOSE
+    VERBOSE = False
+    try:
+        yield
+    finally:
+        VERBOSE = True
+
+
+class _StdoutRouter:
+
+    def __init__(self, fallback: Any) -> None:
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def attach(self, buffer: io.StringIO) -> None:
+        self._local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self._fallback.write(text)
+        return buffer.write(text)
+
+    def flush(self) -> None:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            self._fallback.flush()
+
+
+@dataclass(slots=True)
+class Record:
+    raw: Any
+    type: str
+    valid: bool = False
+    parsed: Any = None
+    action_count: int = 0
+    error: Optional[str] = None
 
 
 class ProcessingStage (Protocol):
@@ -10,73 +70,118 @@ class ProcessingStage (Protocol):
         pass
 
 
-class ProcessingPipeline(ABC):
+def _compile_runner(stages: List["ProcessingStage"]) -> Any:
+    namespace: Dict[str, Any] = {}
+    lines = ["def _run(record):"]
+    for i, stage in enumerate(stages):
+        namespace[f"_stage{i}"] = stage.process
+        lines.append(f"    record = _stage{i}(record)")
+        lines.append("    if record.error is not None:")
+        lines.append("        return record")
+    lines.append("    return record")
+    exec("\n".join(lines), namespace)
+    return namespace["_run"]
+
+
+class ProcessingPipeline:
+
+    __slots__ = ("stages", "pipeline_id", "_run")
+
+    _TYPE: str = "generic"
+    _BANNER: str = "\nProcessing data through pipeline..."
+
     def __init__(self) -> None:
         self.stages: List[ProcessingStage] = []
+        self._run: Optional[Any] = None
 
     def add_stage(self, stage: ProcessingStage) -> None:
         self.stages.append(stage)
+        self._run = None
 
-    @abstractmethod
-    def process(self, data: Any) -> Any:
-        pass
+    def process(self, data: Any) -> Record:
+        print(self._BANNER)
+        run = self._run
+        if run is None:
+            run = self._run = _compile_runner(self.stages)
+        return run(Record(raw=data, type=self._TYPE))
 
 
 class InputStage():
 
     def __init__(self) -> None:
+        self._dispatch = {
+            "json": self._input_json,
+            "csv": self._input_csv,
+            "stream": self._input_stream,
+        }
         print("Stage 1: Input validation and parsing")
 
-    def process(self, data: Any) -> Any:
-        to_print = data.get("to_print")
+    def _input_json(self, data: Record) -> None:
+        if VERBOSE:
+            print(f"Input: {data.raw}")
+
+    def _input_csv(self, data: Record) -> None:
+        if VERBOSE:
+            print(f"Input: \"{data.raw}\"")
+
+    def _input_stream(self, data: Record) -> None:
+        if VERBOSE:
+            print("Input: Real-time sensor stream")
+
+    def process(self, data: Record) -> Record:
         try:
-            if data["type"] == "json":
-                if to_print:
-                    print(f"Input: {data['raw']}")
-            elif data["type"] == "csv":
-                if to_print:
-                    print(f"Input: \"{data['raw']}\"")
-            elif data["type"] == "stream":
-                if to_print:
-                    print("Input: Real-time sensor stream")
-            else:
-                raise ValueError
-            data["valid"] = True
+            self._dispatch[data.type](data)
+            data.valid = True
         except Exception:
-            if to_print:
+            if VERBOSE:
                 print("Error detected in stage 1, Invalid data")
-            data = {"error": "error in stage 1"}
+            data.error = "error in stage 1"
         return data
 
 
 class TransformStage():
 
     def __init__(self) -> None:
+        self._dispatch = {
+            "json": self._transform_json,
+            "csv": self._transform_csv,
+            "stream": self._transform_stream,
+        }
         print("Stage 2: Data transformation and enrichment")
 
-    def process(self, data: Any) -> Dict:
-        to_print = data.get("to_print")
+    def _transform_json(self, data: Record) -> None:
+        raw = data.raw
+        if type(raw) is str:
+            parsed = _PARSE_CACHE.get(raw, _MISSING)
+            if parsed is _MISSING:
+                parsed = _loads(raw)
+                if len(_PARSE_CACHE) >= _PARSE_CACHE_LIMIT:
+                    _PARSE_CACHE.clear()
+                _PARSE_CACHE[raw] = parsed
+            data.parsed = parsed
+        else:
+            data.parsed = _loads(raw)
+        if VERBOSE:
+            print("Transform: Enriched with metadata and validation")
+
+    def _transform_csv(self, data: Record) -> None:
+        data.parsed = next(csv.reader([data.raw]))
+        data.action_count = data.parsed.count("action")
+        if VERBOSE:
+            print("Transform: Parsed and structured data")
+
+    def _transform_stream(self, data: Record) -> None:
+        data.parsed = [float(number) for number in data.raw]
+        if VERBOSE:
+            print("Transform: Aggregated and filtered")
+
+    def process(self, data: Record) -> Record:
         try:
-            type = data["type"]
-            raw = data["raw"]
-            if type == "json":
-                data["parsed"] = json.loads(raw)
-                if to_print:
-                    print("Transform: Enriched with metadata and validation")
-            elif type == "csv":
-                data["parsed"] = raw.split(',')
-                if to_print:
-                    print("Transform: Parsed and structured data")
-            elif type == "stream":
-                data["parsed"] = [float(number) for number in raw]
-                if to_print:
-                    print("Transform: Aggregated and filtered")
-            else:
-                raise ValueError()
+            self._dispatch[data.type](data)
         except Exception:
-            if to_print:
+            if VERBOSE:
                 print("Error detected in Stage 2: Invalid data format")
-            data = {"error": "error in stage 2"}
+            data.error = "error in stage 2"
 
         return data
 
@@ -84,87 +189,79 @@ class TransformStage():
 class OutputStage():
 
     def __init__(self) -> None:
+        self._dispatch = {
+            "json": self._output_json,
+            "csv": self._output_csv,
+            "stream": self._output_stream,
+        }
         print("Stage 3: Output formatting and delivery")
 
-    def process(self, data: Any) -> Any:
-        to_print = data.get("to_print")
-        parsed = data.get("parsed")
-        if data["type"] == "json":
-            temp = parsed.get('value', 0)
-            range = None
-            if 23 < temp < 30:
-                range = "(Normal range)"
-            else:
-                range = "(Out of range range)"
-            if to_print:
-                print(
-                    f"Output: Processed temperature reading: {temp}°C {range}")
-        elif data["type"] == "csv":
-            wc = parsed.count("action")
-            if to_print:
-                print(f"Output: User activity logged: {wc} actions processed")
-        elif data["type"] == "stream":
-            temps: float = 0
-            count: int = 0
-            for temp in parsed:
-                temps += temp
-                count += 1
-            if count == 0:
-                if to_print:
-                    print("Output: Stream summary: 0 readings, avg: 0°C")
-            else:
-                av: float = temps / count
-                if to_print:
-                    print(f"Output: Stream summary: {count}"
-                          f" readings, avg: {av}°C")
+    def _output_json(self, data: Record) -> None:
+        if VERBOSE:
+            temp = data.parsed.get('value', 0)
+            range = _RANGES[23 < temp < 30]
+            print(
+                f"Output: Processed temperature reading: {temp}°C {range}")
+
+    def _output_csv(self, data: Record) -> None:
+        if VERBOSE:
+            wc = data.action_count
+            print(f"Output: User activity logged: {wc} actions processed")
+
+    def _output_stream(self, data: Record) -> None:
+        if not VERBOSE:
+            return
+        parsed = data.parsed
+        count: int = len(parsed)
+        if count == 0:
+            print("Output: Stream summary: 0 readings, avg: 0°C")
+        else:
+            av: float = sum(parsed) / count
+            print(f"Output: Stream summary: {count}"
+                  f" readings, avg: {av}°C")
+
+    def process(self, data: Record) -> Record:
+        handler = self._dispatch.get(data.type)
+        if handler is not None:
+            handler(data)
         return data
 
 
 class JSONAdapter(ProcessingPipeline):
+
+    __slots__ = ()
+
+    _TYPE = sys.intern("json")
+    _BANNER = "\nProcessing JSON data through pipeline..."
+
     def __init__(self, pipeline_id: str) -> None:
         super().__init__()
         self.pipeline_id = pipeline_id
 
-    def process(self, data: Any) -> Union[str, Any]:
-        print("\nProcessing JSON data through pipeline...")
-        data = {"raw": data, "type": "json", "to_print": True}
-        for stage in self.stages:
-            data = stage.process(data)
-            if isinstance(data, dict) and "error" in data:
-                break
-        return data
-
 
 class CSVAdapter(ProcessingPipeline):
+
+    __slots__ = ()
+
+    _TYPE = sys.intern("csv")
+    _BANNER = "\nProcessing CSV data through same pipeline..."
+
     def __init__(self, pipeline_id: str) -> None:
         super().__init__()
         self.pipeline_id = pipeline_id
 
-    def process(self, data: Any) -> Union[str, Any]:
 
-        print("\nProcessing CSV data through same pipeline...")
-        data = {"raw": data, "type": "csv", "to_print": True}
-        for stage in self.stages:
-            data = stage.process(data)
-            if isinstance(data, dict) and "error" in data:
-                break
-        return data
+class StreamAdapter(ProcessingPipeline):
 
+    __slots__ = ()
+
+    _TYPE = sys.intern("stream")
+    _BANNER = "\nProcessing Stream data through same pipeline..."
 
-class StreamAdapter(ProcessingPipeline):
     def __init__(self, pipeline_id: str) -> None:
         super().__init__()
         self.pipeline_id = pipeline_id
 
-    def process(self, data: Any) -> Union[str, Any]:
-        print("\nProcessing Stream data through same pipeline...")
-        data = {"raw": data, "type": "stream", "to_print": True}
-        for stage in self.stages:
-            data = stage.process(data)
-            if isinstance(data, dict) and "error" in data:
-                break
-        return data
-
 
 class NexusManager():
 
@@ -176,23 +273,36 @@ class NexusManager():
     def add_pipeline(self, pipeline: ProcessingPipeline) -> None:
         self.pipelines.append(pipeline)
 
-    def process(self, data_list: List[Any]) -> None:
-        for i in range(len(self.pipelines)):
+    def process(self, data_list: Iterable[Any]) -> None:
+        if not self.pipelines:
+            return
+        router = _StdoutRouter(sys.stdout)
 
-            pipeline = self.pipelines[i]
-            data = data_list[i]
+        def run(pipeline: ProcessingPipeline, data: Any) -> io.StringIO:
+            buffer = io.StringIO()
+            router.attach(buffer)
             pipeline.process(data)
+            return buffer
+
+        async def gather() -> List[io.StringIO]:
+            tasks = [asyncio.to_thread(run, pipeline, data)
+                     for pipeline, data in zip(self.pipelines, data_list)]
+            return await asyncio.gather(*tasks)
+
+        original = sys.stdout
+        sys.stdout = router
+        try:
+            buffers = asyncio.run(gather())
+        finally:
+            sys.stdout = original
+        for buffer in buffers:
+            sys.stdout.write(buffer.getvalue())
 
 
 def test_failure_pipeline(stages: List[ProcessingStage]) -> None:
     print("\n=== Error Recovery Test ===")
     print("Simulating pipeline failure...")
-    invalid_data = {
-        "raw": "hello,world",
-        "type": "json",
-        "valid": False,
-        "to_print": True
-    }
+    invalid_data = Record(raw="hello,world", type="json")
     stages[1].process(invalid_data)
     print("Recovery initiated: Switching to backup processor")
     print("Recovery successful: Pipeline restored, processing"
@@ -201,26 +311,27 @@ def test_failure_pipeline(stages: List[ProcessingStage]) -> None:
 
 def pipeline_chaining(stages: List[ProcessingStage]) -> tuple:
     raw_data = "temp,hh,jj,action"
-    data = {'raw': raw_data, 'type': 'csv', 'to_print': False}
+    data = Record(raw=raw_data, type='csv')
     pipelines: List = []
     data_flow: List = []
 
-    data = stages[0].process(data)
-    if "error" in data:
-        return pipelines, data_flow
-    pipelines.append("Pipeline A")
-    data_flow.append("Raw")
-    data = stages[1].process(data)
-    if "error" in data:
-        return pipelines, data_flow
-    pipelines.append("Pipeline B")
-    data_flow.append("Processed")
-    data_flow.append("Analyzed")
-    data = stages[2].process(data)
-    if "error" in data:
-        return pipelines, data_flow
-    pipelines.append("Pipeline C")
-    data_flow.append("Stored")
+    with quiet():
+        data = stages[0].process(data)
+        if data.error is not None:
+            return pipelines, data_flow
+        pipelines.append("Pipeline A")
+        data_flow.append("Raw")
+        data = stages[1].process(data)
+        if data.error is not None:
+            return pipelines, data_flow
+        pipelines.append("Pipeline B")
+        data_flow.append("Processed")
+        data_flow.append("Analyzed")
+        data = stages[2].process(data)
+        if data.error is not None:
+            return pipelines, data_flow
+        pipelines.append("Pipeline C")
+        data_flow.append("Stored")
     return pipelines, data_flow, data
 
 
@@ -252,7 +363,8 @@ def main() -> Optional[int]:
             "user,action,timestamp",
             [22.1, 21.8, 22.5, 23.0, 21.1]
         ]
-        manager.process(data_to_process * 50)
+        manager.process(itertools.chain.from_iterable(
+            itertools.repeat(data_to_process, 50)))
         data_flow = pipeline_chaining(stages)
         if data_flow and len(data_flow) >= 2:
             if data_flow[0]:
@@ -261,7 +373,7 @@ def main() -> Optional[int]:
             if data_flow[1]:
                 print("Data flow:", " -> ".join(data_flow[1]))
             if len(data_flow) == 3 and data_flow[2]:
-                records = len(data_flow[2]["parsed"])
+                records = len(data_flow[2].parsed)
                 print(f"Chain result: {records} records processed through "
                       f"{len(data_flow[0])}-stage pipeline")
 
@@ -278,4 +390,7 @@ def main() -> Optional[int]:
 
 
 if __name__ == "__main__":
-    main()
+    _buffer = io.StringIO()
+    with contextlib.redirect_stdout(_buffer):
+        main()
+    sys.stdout.write(_buffer.getvalue())